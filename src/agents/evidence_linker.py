@@ -4,7 +4,7 @@ from typing import List, Dict
 import pandas as pd
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from qdrant_setup import QdrantRealDataManager
+from qdrant_setup import QdrantRealDataManager, SearchRequest
 
 class EvidenceLinkerAgent:
     """
@@ -19,14 +19,28 @@ class EvidenceLinkerAgent:
         """
         Find specific scientific evidence supporting the design choices of a candidate.
         """
-        print(f"[Evidence Linker] 🔗 Linking evidence for {candidate['candidate_id']}")
-        
-        # 1. Search for papers mentioning both the mutation and binding motifs
-        motifs = self._extract_key_motifs(candidate)
-        query = f"HER2 {mutation_id} antibody binding {', '.join(motifs)}"
-        
-        relevant_papers = self.qdrant.search_literature(query=query, mutation_filter=mutation_id, limit=5)
+        return self.link_evidence_batch(mutation_id, [candidate])[0]
+    
+    def link_evidence_batch(self, mutation_id: str, candidates: List[Dict]) -> List[Dict]:
+        """
+        link_evidence for several candidates, with all literature searches issued as one batch.
+        """
+        # 1. Search for papers mentioning both the mutation and each candidate's binding motifs
+        requests = []
+        for candidate in candidates:
+            print(f"[Evidence Linker] 🔗 Linking evidence for {candidate['candidate_id']}")
+            motifs = self._extract_key_motifs(candidate)
+            query = f"HER2 {mutation_id} antibody binding {', '.join(motifs)}"
+            requests.append(SearchRequest("scientific_literature", query, 5, mutation_id))
         
+        papers_per_candidate = self.qdrant.search_multi(requests)
+        return [
+            self._summarize_evidence(mutation_id, candidate, relevant_papers)
+            for candidate, relevant_papers in zip(candidates, papers_per_candidate)
+        ]
+    
+    def _summarize_evidence(self, mutation_id: str, candidate: Dict, relevant_papers: List[Dict]) -> Dict:
+        """Evidence statements and support score for a candidate from its retrieved papers"""
         # 2. Extract 'Actionable Evidence' sentences
         evidence_statements = self._extract_evidence_statements(relevant_papers, mutation_id)
         
@@ -3,7 +3,7 @@ from typing import List, Dict
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from qdrant_setup import QdrantRealDataManager
+from qdrant_setup import QdrantRealDataManager, SearchRequest
 class SimilarityScoutAgent:
     """
     Agent that finds similar mutations and related information from Qdrant.
@@ -19,18 +19,12 @@ class SimilarityScoutAgent:
         """
         print(f"[Similarity Scout] 🔍 Searching for analogs of {mutation_id}")
         
-        # Search for similar mutations in Qdrant
-        similar_mutations = self.qdrant.search_mutations(
-            query=f"HER2 mutation {mutation_id} resistance",
-            limit=5
-        )
-        
-        # Get literature specifically about this mutation
-        literature = self.qdrant.search_literature(
-            query=f"HER2 {mutation_id} resistance mechanism",
-            mutation_filter=mutation_id,
-            limit=3
-        )
+        # Search for similar mutations and for literature specifically about this
+        # mutation in one batched pass
+        similar_mutations, literature = self.qdrant.search_multi([
+            SearchRequest("her2_mutations", f"HER2 mutation {mutation_id} resistance", 5),
+            SearchRequest("scientific_literature", f"HER2 {mutation_id} resistance mechanism", 3, mutation_id)
+        ])
         
         # Calculate evidence score
         evidence_score = self._calculate_evidence_score(similar_mutations, literature)
@@ -1,9 +1,12 @@
 import argparse
+import asyncio
 import json
 from datetime import datetime
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterator, List
 import pandas as pd
 import os
+import sys
 
 from qdrant_setup import QdrantRealDataManager
 from data_loader import HER2DataLoader
@@ -12,6 +15,17 @@ from agents.antibody_designer import AntibodyDesignerAgent
 from agents.feasibility_checker import FeasibilityCheckerAgent
 from agents.evidence_linker import EvidenceLinkerAgent
 
+# Mutations exercised by --demo
+DEMO_MUTATIONS = ("L755S", "T798I", "D769H", "V777L")
+
+# Advanced data tables: (orchestrator attribute, CSV path); missing files load as empty frames
+OPTIONAL_TABLES = (
+    ("protocols", Path("data/raw/synthesis_protocols.csv")),
+    ("lab_notes", Path("data/raw/lab_notes.csv")),
+    ("experimental_results", Path("data/raw/experimental_results.csv")),
+    ("images", Path("data/raw/images_metadata.csv")),
+)
+
 class RealDataOrchestrator:
     """
     Main orchestrator using real biological data.
@@ -25,8 +39,15 @@ class RealDataOrchestrator:
         # Initialize data loader
         self.data_loader = HER2DataLoader()
         
-        # Initialize Qdrant with real data
-        self.qdrant_manager = QdrantRealDataManager()
+        # Initialize Qdrant with real data: the server at QDRANT_HOST[:QDRANT_PORT] when set,
+        # otherwise an in-process ':memory:' store
+        qdrant_host = os.environ.get("QDRANT_HOST")
+        if qdrant_host:
+            qdrant_port = int(os.environ.get("QDRANT_PORT", 6333))
+            print(f"   Using Qdrant server at {qdrant_host}:{qdrant_port}")
+            self.qdrant_manager = QdrantRealDataManager(host=qdrant_host, port=qdrant_port, location=None)
+        else:
+            self.qdrant_manager = QdrantRealDataManager()
         
         # Initialize agents
         self.scout_agent = SimilarityScoutAgent(self.qdrant_manager)
@@ -43,20 +64,12 @@ class RealDataOrchestrator:
                 self.abstracts = pd.read_csv("data/processed/abstracts_processed.csv")
                 
                 # Advanced Data
-                self.protocols = pd.read_csv("data/raw/synthesis_protocols.csv") if os.path.exists("data/raw/synthesis_protocols.csv") else pd.DataFrame()
-                self.lab_notes = pd.read_csv("data/raw/lab_notes.csv") if os.path.exists("data/raw/lab_notes.csv") else pd.DataFrame()
-                self.experimental_results = pd.read_csv("data/raw/experimental_results.csv") if os.path.exists("data/raw/experimental_results.csv") else pd.DataFrame()
-                self.images = pd.read_csv("data/raw/images_metadata.csv") if os.path.exists("data/raw/images_metadata.csv") else pd.DataFrame()
+                for name, path in OPTIONAL_TABLES:
+                    setattr(self, name, pd.read_csv(path) if path.is_file() else pd.DataFrame())
                 
                 # Load data to Qdrant
                 print("   Loading data to Qdrant...")
-                self.qdrant_manager.load_mutations_to_qdrant(self.mutations)
-                self.qdrant_manager.load_antibodies_to_qdrant(self.antibodies)
-                self.qdrant_manager.load_abstracts_to_qdrant(self.abstracts)
-                self.qdrant_manager.load_protocols_to_qdrant(self.protocols)
-                self.qdrant_manager.load_lab_notes_to_qdrant(self.lab_notes)
-                self.qdrant_manager.load_experimental_results_to_qdrant(self.experimental_results)
-                self.qdrant_manager.seed_experiments()
+                self._load_to_qdrant()
                 
             except FileNotFoundError:
                 print("   No existing data found, creating new...")
@@ -78,14 +91,36 @@ class RealDataOrchestrator:
         self.qdrant_manager.initialize_collections()
         
         print("\n📤 Loading data to Qdrant...")
+        self._load_to_qdrant()
+    
+    def _load_to_qdrant(self):
+        """Load every collection, concurrently when the uploads go to a Qdrant server"""
+        if self.qdrant_manager.uses_server:
+            asyncio.run(self._load_to_qdrant_async())
+            return
+        
+        # In-process client: no network I/O to overlap, and concurrent loads would only
+        # contend for the one shared model, so load the collections one after another
         self.qdrant_manager.load_mutations_to_qdrant(self.mutations)
         self.qdrant_manager.load_antibodies_to_qdrant(self.antibodies)
-        self.qdrant_manager.load_abstracts_to_qdrant(self.abstracts)
+        self.qdrant_manager.load_abstracts_to_qdrant(self.abstracts, self.mutations.get('mutation_id'))
         self.qdrant_manager.load_protocols_to_qdrant(self.protocols)
         self.qdrant_manager.load_lab_notes_to_qdrant(self.lab_notes)
         self.qdrant_manager.load_experimental_results_to_qdrant(self.experimental_results)
         self.qdrant_manager.seed_experiments()
     
+    async def _load_to_qdrant_async(self):
+        """Load every collection concurrently; each loader targets its own collection"""
+        await asyncio.gather(
+            self.qdrant_manager.load_mutations_async(self.mutations),
+            self.qdrant_manager.load_antibodies_async(self.antibodies),
+            self.qdrant_manager.load_abstracts_async(self.abstracts, self.mutations.get('mutation_id')),
+            self.qdrant_manager.load_protocols_async(self.protocols),
+            self.qdrant_manager.load_lab_notes_async(self.lab_notes),
+            self.qdrant_manager.load_experimental_results_async(self.experimental_results),
+            self.qdrant_manager.seed_experiments_async()
+        )
+    
     def _show_system_status(self):
         """Display system status"""
         stats = self.qdrant_manager.get_collection_stats()
@@ -104,6 +139,14 @@ class RealDataOrchestrator:
         """
         Run complete pipeline for a specific mutation.
         """
+        stages = list(self.stream_for_mutation(mutation_id, num_candidates))
+        return stages[-1]["report"]
+    
+    def stream_for_mutation(self, mutation_id: str, num_candidates: int = 3) -> Iterator[Dict]:
+        """
+        Run the pipeline for a mutation, yielding each stage's results as soon as they are ready:
+        analogs, antibodies, candidates and finally the report.
+        """
         print(f"\n🎯 PROCESSING MUTATION: {mutation_id}")
         print("=" * 60)
         
@@ -123,6 +166,7 @@ class RealDataOrchestrator:
         
         evidence_score = scout_results['evidence_score']
         print(f"   Evidence Score: {evidence_score:.3f}")
+        yield {"stage": "analogs", "scout": scout_results}
         
         # Step 2: Find relevant antibodies for inspiration
         print("\n[2/4] 💉 FINDING RELEVANT ANTIBODIES")
@@ -140,6 +184,7 @@ class RealDataOrchestrator:
         else:
             print("   No directly relevant antibodies found, using general design")
             template_cdr3 = None
+        yield {"stage": "antibodies", "mutation": mutation_id, "relevant_antibodies": relevant_antibodies}
         
         # Step 3: Antibody Designer - Generate new candidates
         print(f"\n[3/4] 🧬 DESIGNING NEW ANTIBODIES")
@@ -150,19 +195,22 @@ class RealDataOrchestrator:
         )
         
         print(f"   Designed {len(candidates)} candidate antibodies")
+        yield {"stage": "candidates", "mutation": mutation_id, "candidates": candidates}
         
         # Step 4: Feasibility Check - Evaluate each candidate
         print(f"\n[4/4] ⚙️ FEASIBILITY ASSESSMENT")
         ranked_candidates = []
         
-        for candidate in candidates:
+        # Link evidence for every candidate with one batched literature search
+        evidence_links = self.linker_agent.link_evidence_batch(mutation_id, candidates)
+        
+        for candidate, evidence_link in zip(candidates, evidence_links):
             print(f"   Evaluating {candidate['candidate_id']}...", end=" ")
             
             # Evaluate feasibility
             feasibility = self.checker_agent.evaluate_candidate(candidate)
             
-            # Link evidence and get scientific support score
-            evidence_link = self.linker_agent.link_evidence(mutation_id, candidate)
+            # Scientific support score from the linked evidence
             support_score = evidence_link['scientific_support_score']
             
             # Combine scores: 40% evidence, 30% design, 30% feasibility
@@ -190,7 +238,7 @@ class RealDataOrchestrator:
         # Step 5: Generate final report
         final_report = self._generate_report(mutation_id, ranked_candidates, scout_results)
         
-        return final_report
+        yield {"stage": "report", "report": final_report}
     
     def _generate_report(self, mutation_id: str, candidates: List[Dict], scout_results: Dict) -> Dict:
         """Generate comprehensive report"""
@@ -267,42 +315,47 @@ class RealDataOrchestrator:
     
     def display_results(self, report: Dict):
         """Display results in a readable format"""
-        print("\n" + "=" * 70)
-        print("✅ PIPELINE COMPLETE - FINAL RESULTS")
-        print("=" * 70)
+        lines: List[str] = []
+        lines.append("\n" + "=" * 70)
+        lines.append("✅ PIPELINE COMPLETE - FINAL RESULTS")
+        lines.append("=" * 70)
         
         mutation = report['mutation']
-        print(f"\nMutation: {mutation}")
-        print(f"Evidence Score: {report['evidence_found']['evidence_score']:.3f}")
-        print(f"Candidates Generated: {report['summary']['candidates_generated']}")
-        print(f"Top Score: {report['summary']['top_score']:.3f}")
+        lines.append(f"\nMutation: {mutation}")
+        lines.append(f"Evidence Score: {report['evidence_found']['evidence_score']:.3f}")
+        lines.append(f"Candidates Generated: {report['summary']['candidates_generated']}")
+        lines.append(f"Top Score: {report['summary']['top_score']:.3f}")
         
-        print(f"\n📚 Evidence Found:")
-        print(f"   • Similar mutations: {report['evidence_found']['similar_mutations']}")
-        print(f"   • Relevant papers: {report['evidence_found']['relevant_papers']}")
+        lines.append(f"\n📚 Evidence Found:")
+        lines.append(f"   • Similar mutations: {report['evidence_found']['similar_mutations']}")
+        lines.append(f"   • Relevant papers: {report['evidence_found']['relevant_papers']}")
         
-        print(f"\n🏆 TOP CANDIDATES:")
+        lines.append(f"\n🏆 TOP CANDIDATES:")
         for i, candidate in enumerate(report['top_candidates'], 1):
-            print(f"\n  #{i}: {candidate['candidate_id']}")
-            print(f"     Combined Score: {candidate['combined_score']:.3f}")
-            print(f"     Evidence: {candidate['evidence_score']:.3f}")
-            print(f"     Design Confidence: {candidate['design_confidence']:.3f}")
-            print(f"     Feasibility: {candidate['feasibility_score']:.3f} ({candidate['feasibility_category']})")
-            print(f"     CDR3: {candidate['cdr3'][:20]}...")
+            lines.append(f"\n  #{i}: {candidate['candidate_id']}")
+            lines.append(f"     Combined Score: {candidate['combined_score']:.3f}")
+            lines.append(f"     Evidence: {candidate['evidence_score']:.3f}")
+            lines.append(f"     Design Confidence: {candidate['design_confidence']:.3f}")
+            lines.append(f"     Feasibility: {candidate['feasibility_score']:.3f} ({candidate['feasibility_category']})")
+            lines.append(f"     CDR3: {candidate['cdr3'][:20]}...")
             
             if candidate.get('passes'):
-                print(f"     ✓ {candidate['passes'][0]}")
+                lines.append(f"     ✓ {candidate['passes'][0]}")
             
             if candidate.get('issues'):
-                print(f"     ⚠️  {candidate['issues'][0]}")
+                lines.append(f"     ⚠️  {candidate['issues'][0]}")
         
-        print(f"\n💡 RECOMMENDATIONS:")
+        lines.append(f"\n💡 RECOMMENDATIONS:")
         for rec in report['recommendations']:
-            print(f"   • {rec}")
+            lines.append(f"   • {rec}")
         
-        print(f"\n📊 Next steps saved to: {report.get('report_id', 'report')}")
+        lines.append(f"\n📊 Next steps saved to: {report.get('report_id', 'report')}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser for the pipeline"""
     parser = argparse.ArgumentParser(
         description="HER2-ResistAID: Real Data Pipeline for Antibody Design"
     )
@@ -333,16 +386,20 @@ def main():
         help="Skip loading data (use existing)"
     )
     
-    args = parser.parse_args()
+    return parser
+
+_PARSER = _build_parser()
+
+def main():
+    args = _PARSER.parse_args()
     
     # Run pipeline
     orchestrator = RealDataOrchestrator(use_existing_data=args.skip_data_load)
     
     if args.demo:
         print("\n🎪 DEMONSTRATION MODE")
-        demo_mutations = ["L755S", "T798I", "D769H", "V777L"]
         
-        for mutation in demo_mutations:
+        for mutation in DEMO_MUTATIONS:
             report = orchestrator.run_for_mutation(mutation, num_candidates=2)
             orchestrator.display_results(report)
             print("\n" + "=" * 70 + "\n")
@@ -351,8 +408,4 @@ def main():
         orchestrator.display_results(report)
 
 if __name__ == "__main__":
-    import os
-    os.makedirs("data", exist_ok=True)
-    os.makedirs("reports", exist_ok=True)
-    
-    main()
\ No newline at end of file
+    main()
@@ -1,30 +1,239 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
-from qdrant_client import QdrantClient
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
-    Distance, VectorParams, PointStruct, Filter,
-    FieldCondition, MatchValue, CollectionInfo
+    Distance, VectorParams, Filter,
+    FieldCondition, MatchValue, CollectionInfo, Batch, OptimizersConfigDiff,
+    Datatype, ScalarQuantization, ScalarQuantizationConfig, ScalarType, QueryRequest, PayloadSchemaType
 )
+import sentence_transformers
 from sentence_transformers import SentenceTransformer
+import torch
+import asyncio
+import atexit
 import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
-from tqdm import tqdm
+import os
+import re
+
+try:
+    import ahocorasick  # optional: pyahocorasick, a C automaton for mention scanning
+except ImportError:
+    ahocorasick = None
+
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+EMBEDDING_DIM = 384
+
+# Prebuilt ONNX graphs published with the model: O3 is graph-optimized (fused attention/GELU),
+# the int8 variant is dynamically quantized for AVX-512 VNNI CPUs
+ONNX_MODEL_FILES = {
+    'onnx': 'onnx/model_O3.onnx',
+    'onnx-int8': 'onnx/model_qint8_avx512_vnni.onnx'
+}
+
+def _default_device() -> str:
+    return 'cuda' if torch.cuda.is_available() else 'cpu'
+
+# One loaded embedder per configuration, shared by every manager in the process
+@lru_cache(maxsize=None)
+def _get_embedder(name: str, device: str, backend: str = "torch", use_fp16: bool = True,
+                  max_seq_length: Optional[int] = None) -> SentenceTransformer:
+    """Load a sentence embedder once per configuration and reuse it afterwards"""
+    if backend in ONNX_MODEL_FILES:
+        # ONNX Runtime backend (pip install "sentence-transformers[onnx]>=3.2")
+        version = tuple(int(part) for part in re.findall(r"\d+", sentence_transformers.__version__)[:2])
+        if version < (3, 2):
+            raise ImportError(
+                f"backend={backend!r} needs sentence-transformers>=3.2 with the onnx extra, "
+                f"found {sentence_transformers.__version__}"
+            )
+        provider = 'CUDAExecutionProvider' if device == 'cuda' else 'CPUExecutionProvider'
+        embedder = SentenceTransformer(
+            name, device=device, backend='onnx',
+            model_kwargs={'file_name': ONNX_MODEL_FILES[backend], 'provider': provider}
+        )
+    else:
+        embedder = SentenceTransformer(name, device=device)
+        if device == 'cuda' and use_fp16:
+            embedder.half()
+    if max_seq_length:
+        # Texts are truncated to this many tokens by the (Rust) tokenizer inside encode()
+        embedder.max_seq_length = max_seq_length
+    if device == 'cpu':
+        # All cores for intra-op matmuls, one inter-op thread so the pools don't oversubscribe
+        torch.set_num_threads(os.cpu_count() or 1)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # can only be set before the first parallel op in the process
+    
+    return embedder
+
+# payload_schema types that get a payload index when listed in a collection's indexed_fields
+PAYLOAD_INDEX_TYPES = {
+    "keyword": PayloadSchemaType.KEYWORD,
+    "keyword[]": PayloadSchemaType.KEYWORD,
+    "integer": PayloadSchemaType.INTEGER,
+    "float": PayloadSchemaType.FLOAT
+}
+
+# HNSW indexing is switched off during bulk loads and restored to this threshold afterwards
+INDEXING_THRESHOLD = 20000
+
+# Query embedding cache: entry count, and the prefix length used as key (and embedded)
+QUERY_CACHE_SIZE = 4096
+QUERY_CACHE_KEY_CHARS = 1024
+
+# Async query micro-batching: how long to gather concurrent queries, and the most per forward pass
+QUERY_BATCH_WINDOW = 0.005
+QUERY_BATCH_SIZE = 32
+
+# HER2 point mutations recognised when tagging literature mentions
+KNOWN_MUTATIONS = frozenset({
+    "S310F", "R678Q", "K753E", "L755S", "L755P", "D769H", "D769Y",
+    "G776V", "V777L", "T798I", "T798M", "V842I", "L869R", "T862A"
+})
+# Short protein-change form (L755S, R678*); only catalog IDs of this shape are used as mention patterns
+PROTEIN_CHANGE = re.compile(r"[A-Z]\d+[A-Z*]")
+# Mention matchers compiled per pattern set; the catalog rarely changes between loads
+@lru_cache(maxsize=8)
+def _mention_matcher(patterns: FrozenSet[str]):
+    """Lowercased Aho-Corasick automaton over patterns, or a word-bounded regex without pyahocorasick"""
+    if ahocorasick is None:
+        # Longest alternatives first so overlapping IDs resolve to the full token. Lookarounds
+        # rather than \b, which would also match after a pattern's trailing non-word character
+        alternatives = sorted(patterns, key=len, reverse=True)
+        return re.compile(r"(?<!\w)(" + "|".join(map(re.escape, alternatives)) + r")(?!\w)", re.IGNORECASE)
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern.lower(), pattern)
+    automaton.make_automaton()
+    return automaton
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Whether text[index] exists and is a regex word character"""
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == '_')
+
+def _find_mentions(texts: pd.Series, patterns: FrozenSet[str] = KNOWN_MUTATIONS) -> List[List[str]]:
+    """Whole-word, case-insensitive mentions of patterns per text, spelled as in patterns and deduplicated in order of appearance"""
+    texts = texts.fillna('').astype(str)
+    matcher = _mention_matcher(patterns)
+    if isinstance(matcher, re.Pattern):
+        spelling = {pattern.lower(): pattern for pattern in patterns}
+        return [list(dict.fromkeys(spelling[m.lower()] for m in found)) for found in texts.str.findall(matcher)]
+    
+    mentions = []
+    for text in texts.str.lower():
+        found = {}
+        for end, mutation in matcher.iter(text):
+            start = end - len(mutation) + 1
+            # Same word boundaries as the regex fallback
+            if not _is_word_char(text, start - 1) and not _is_word_char(text, end + 1):
+                found.setdefault(mutation, start)
+        mentions.append(sorted(found, key=found.get))
+    return mentions
+
+def _str_column(df: pd.DataFrame, column: str, default: str = '') -> pd.Series:
+    """Column rendered cell by cell with str (NaN -> 'nan', as in an f-string), or a constant when absent"""
+    if column in df.columns:
+        # Not astype(str): from pandas 3 it leaves missing values as NaN, which would turn
+        # every concatenated text containing them into NaN
+        return df[column].map(str)
+    return pd.Series(default, index=df.index, dtype=object)
+
+def _normalize_columns(df: pd.DataFrame, defaults: Dict[str, object]) -> pd.DataFrame:
+    """Copy of df where each column in defaults exists, has NaNs filled and is cast to the default's type"""
+    df = df.copy()
+    for column, default in defaults.items():
+        if column not in df.columns:
+            df[column] = default
+        elif isinstance(default, str):
+            df[column] = df[column].fillna(default).astype(str)
+        else:
+            df[column] = pd.to_numeric(df[column], errors='coerce').fillna(default).astype(type(default))
+    return df
+
+def _point_id(key: str, offset: int = 0) -> int:
+    """Stable 40-bit hash of key, placed in the collection's ID range via the high bits"""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=5).digest(), "big") | offset
+
+def _point_ids(keys: pd.Series, offset: int = 0) -> np.ndarray:
+    """_point_id for every key in a column"""
+    return np.fromiter((_point_id(str(key), offset) for key in keys), dtype=np.uint64, count=len(keys))
+
+def _list_column(df: pd.DataFrame, column: str) -> List[list]:
+    """Per-row list values of a column, with [] wherever the value is missing or not a list"""
+    if column not in df.columns:
+        return [[] for _ in range(len(df))]
+    return [value if isinstance(value, list) else [] for value in df[column]]
+
+class SearchRequest(NamedTuple):
+    """One search for QdrantRealDataManager.search_multi"""
+    collection: str
+    query: str
+    limit: int
+    mutation_filter: Optional[str] = None
 
 class QdrantRealDataManager:
     """
     Qdrant manager that handles real biological data.
     """
     
-    def __init__(self, host: str = "localhost", port: int = 6333):
-        self.client = QdrantClient(":memory:")
-        self.embedder = SentenceTransformer('all-MiniLM-L6-v2')
+    def __init__(self, host: str = "localhost", port: int = 6333, location: Optional[str] = ":memory:",
+                 parallel: Optional[int] = None, use_fp16: bool = True, backend: str = "torch",
+                 embedding_dim: Optional[int] = None, max_seq_length: Optional[int] = None,
+                 path: Optional[str] = None):
+        # One client (and connection pool) for the manager's lifetime.
+        # location=None connects to the server at host:port over gRPC;
+        # path keeps the in-process database persisted in that directory instead of :memory:
+        self._server = None
+        if location is None:
+            self._server = {"host": host, "port": port, "prefer_grpc": True, "timeout": 30}
+            self.client = QdrantClient(**self._server)
+        elif path is not None:
+            self.client = QdrantClient(path=path)
+        else:
+            self.client = QdrantClient(location)
+        atexit.register(self.client.close)
+        
+        # Concurrent uploads only help against a real server; the local client runs in-process.
+        # By default keep one batch in flight per two CPU cores
+        if parallel is None:
+            parallel = max(1, (os.cpu_count() or 2) // 2)
+        self.parallel = parallel if location is None else 1
+        
+        # Run the embedder on GPU when available (FP16 unless disabled), else use every CPU core
+        # max_seq_length caps tokens per text (the model default is 256); shorter is faster
+        self.embedder = _get_embedder(EMBEDDING_MODEL, _default_device(), backend, use_fp16, max_seq_length)
+        
+        # Optionally keep only the leading embedding_dim components of every vector
+        # (truncated, then re-normalized); the model itself is shared and untouched
+        self.vector_size = embedding_dim or EMBEDDING_DIM
+        self._encode_kwargs = {"normalize_embeddings": True}
+        if embedding_dim:
+            self._encode_kwargs["truncate_dim"] = embedding_dim
+        
+        # Per-instance LRU of query embeddings, shared by every search path; repeated
+        # searches skip the model entirely. Searches run from worker threads, hence the lock
+        self._query_cache: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        
+        # Micro-batcher for async searches, created on first use inside an event loop
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_loop = None
+        self._batch_worker = None
         
         # Collections for real data
         self.collections = {
             "her2_mutations": {
                 "name": "her2_mutations",
-                "vector_size": 384,
+                "vector_size": self.vector_size,
+                "id_offset": 0,
                 "payload_schema": {
                     "mutation_id": "keyword",
                     "gene": "keyword",
@@ -34,11 +243,21 @@ class QdrantRealDataManager:
                     "clinical_significance": "keyword",
                     "resistance_info": "text",
                     "pubmed_refs": "keyword[]"
+                },
+                "indexed_fields": ["mutation_id", "clinical_significance"],
+                "payload_defaults": {
+                    "gene": "ERBB2",
+                    "amino_acid_change": "",
+                    "mutation_type": "Missense_Mutation",
+                    "protein_position": 0,
+                    "clinical_significance": "Unknown",
+                    "resistance_info": ""
                 }
             },
             "antibody_db": {
                 "name": "antibody_database",
-                "vector_size": 384,
+                "vector_size": self.vector_size,
+                "id_offset": 1 << 40,
                 "payload_schema": {
                     "antibody_id": "keyword",
                     "name": "keyword",
@@ -51,11 +270,23 @@ class QdrantRealDataManager:
                     "source": "keyword",
                     "pdb_id": "keyword",
                     "reference": "text"
+                },
+                "indexed_fields": ["antibody_id", "target"],
+                "payload_defaults": {
+                    "target": "HER2",
+                    "sequence": "",
+                    "cdr1": "",
+                    "cdr2": "",
+                    "affinity_nM": 0.0,
+                    "source": "Unknown",
+                    "pdb_id": "",
+                    "reference": ""
                 }
             },
             "scientific_literature": {
                 "name": "scientific_literature",
-                "vector_size": 384,
+                "vector_size": self.vector_size,
+                "id_offset": 2 << 40,
                 "payload_schema": {
                     "pmid": "keyword",
                     "title": "text",
@@ -66,11 +297,19 @@ class QdrantRealDataManager:
                     "keywords": "keyword[]",
                     "mutation_mentions": "keyword[]",
                     "antibody_mentions": "keyword[]"
+                },
+                "indexed_fields": ["mutation_mentions", "antibody_mentions", "year"],
+                "payload_defaults": {
+                    "title": "",
+                    "abstract": "",
+                    "year": 0,
+                    "author": ""
                 }
             },
             "lab_experiments": {
                 "name": "lab_experiments",
-                "vector_size": 384,
+                "vector_size": self.vector_size,
+                "id_offset": 3 << 40,
                 "payload_schema": {
                     "exp_id": "keyword",
                     "mutation": "keyword",
@@ -78,33 +317,39 @@ class QdrantRealDataManager:
                     "measurements": "float",
                     "outcome": "keyword",
                     "notes": "text"
-                }
+                },
+                "indexed_fields": ["mutation", "outcome"]
             },
             "synthesis_protocols": {
                 "name": "synthesis_protocols",
-                "vector_size": 384,
+                "vector_size": self.vector_size,
+                "id_offset": 4 << 40,
                 "payload_schema": {
                     "protocol_id": "keyword",
                     "name": "text",
                     "steps": "text",
                     "reagents": "text",
                     "target": "keyword"
-                }
+                },
+                "indexed_fields": ["target"]
             },
             "lab_notes": {
                 "name": "lab_notes",
-                "vector_size": 384,
+                "vector_size": self.vector_size,
+                "id_offset": 5 << 40,
                 "payload_schema": {
                     "note_id": "keyword",
                     "experimenter": "keyword",
                     "text": "text",
                     "mutation_context": "keyword",
                     "date": "keyword"
-                }
+                },
+                "indexed_fields": ["mutation_context"]
             },
             "experimental_results": {
                 "name": "experimental_results",
-                "vector_size": 384,
+                "vector_size": self.vector_size,
+                "id_offset": 6 << 40,
                 "payload_schema": {
                     "result_id": "keyword",
                     "candidate_id": "keyword",
@@ -112,263 +357,471 @@ class QdrantRealDataManager:
                     "measurement": "float",
                     "unit": "keyword",
                     "interpretation": "text"
-                }
+                },
+                "indexed_fields": ["candidate_id"]
             }
         }
     
+    @property
+    def uses_server(self) -> bool:
+        """Whether the manager talks to a Qdrant server rather than an in-process store"""
+        return self._server is not None
+    
+    @classmethod
+    def preload(cls, backend: str = "torch", use_fp16: bool = True, max_seq_length: Optional[int] = None):
+        """Load the embedder ahead of time (e.g. at application startup) so managers start instantly"""
+        _get_embedder(EMBEDDING_MODEL, _default_device(), backend, use_fp16, max_seq_length)
+    
     def initialize_collections(self):
         """Initialize all Qdrant collections with proper configuration"""
         print("Initializing Qdrant collections...")
         
         for col_name, config in self.collections.items():
-            try:
-                # Delete if exists
+            if self.client.collection_exists(collection_name=config["name"]):
                 self.client.delete_collection(collection_name=config["name"])
-            except:
-                pass
             
-            # Create collection
+            # int8 copies of the vectors kept in RAM for search, clipped at the 0.99 quantile
+            quantization = ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+            
+            # Create collection; a server keeps original vectors and payloads in mmapped
+            # files (searches use the in-RAM quantized copies), the in-process client has no such storage
+            on_disk = self._server is not None
             self.client.create_collection(
                 collection_name=config["name"],
                 vectors_config=VectorParams(
                     size=config["vector_size"],
-                    distance=Distance.COSINE
-                )
+                    distance=Distance.DOT,
+                    datatype=Datatype.FLOAT16,
+                    on_disk=on_disk
+                ),
+                on_disk_payload=on_disk,
+                quantization_config=quantization,
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=0)
             )
+            
+            # Payload indexes for the fields searches filter on (the in-process client has none)
+            if self._server is not None:
+                for field in config.get("indexed_fields", []):
+                    self.client.create_payload_index(
+                        collection_name=config["name"],
+                        field_name=field,
+                        field_schema=PAYLOAD_INDEX_TYPES[config["payload_schema"][field]]
+                    )
             print(f"✅ Created collection: {config['name']}")
     
+    def _encode_and_upsert(self, collection: str, texts: List[str], ids: np.ndarray, payloads: List[Dict]):
+        """Embed all texts in one batched forward pass and upload them in batches"""
+        vectors = self.embedder.encode(
+            texts,
+            batch_size=64,
+            convert_to_numpy=True,
+            show_progress_bar=True,
+            **self._encode_kwargs
+        ).astype(np.float32, copy=False)
+        ids = ids.tolist()  # the client validates IDs as Python ints
+        
+        if self._server is not None:
+            upload = self._async_upsert_batches(collection, ids, vectors, payloads)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(upload)
+            else:
+                # Called from inside an event loop (a notebook, an async handler):
+                # asyncio.run would raise there, so give the upload its own loop in a worker thread
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    executor.submit(asyncio.run, upload).result()
+        else:
+            self.client.upload_collection(
+                collection_name=collection,
+                vectors=vectors,
+                payload=payloads,
+                ids=ids,
+                batch_size=256,
+                wait=True
+            )
+        self._restore_indexing(collection)
+        return len(ids)
+    
+    def _restore_indexing(self, collection: str):
+        """Re-enable HNSW indexing once a bulk load into the collection is done"""
+        self.client.update_collection(
+            collection_name=collection,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=INDEXING_THRESHOLD)
+        )
+    
+    async def _async_upsert_batches(self, collection: str, ids: List[int], vectors: np.ndarray,
+                                    payloads: List[Dict], batch_size: int = 256):
+        """Upsert points to the server in batches, keeping up to self.parallel requests in flight"""
+        # A fresh async client per upload: its connections are bound to the running event loop
+        aclient = AsyncQdrantClient(**self._server)
+        semaphore = asyncio.Semaphore(self.parallel)
+        
+        async def upsert_batch(start: int, wait: bool):
+            end = start + batch_size
+            async with semaphore:
+                await aclient.upsert(
+                    collection_name=collection,
+                    points=Batch(ids=ids[start:end], vectors=vectors[start:end].tolist(), payloads=payloads[start:end]),
+                    wait=wait
+                )
+        
+        starts = range(0, len(ids), batch_size)
+        try:
+            # Intermediate batches return once they are in the write-ahead log; the server
+            # applies updates in order, so waiting on the last batch covers all of them
+            await asyncio.gather(*(upsert_batch(start, wait=False) for start in starts[:-1]))
+            if starts:
+                await upsert_batch(starts[-1], wait=True)
+        finally:
+            await aclient.close()
+    
     def load_mutations_to_qdrant(self, mutations_df: pd.DataFrame):
         """Load mutation data to Qdrant"""
         print(f"Loading {len(mutations_df)} mutations to Qdrant...")
+        config = self.collections["her2_mutations"]
         
-        points = []
-        
-        for idx, row in tqdm(mutations_df.iterrows(), total=len(mutations_df)):
-            # Create embedding text
-            embed_text = f"""
-            Mutation: {row.get('amino_acid_change', '')}
-            Gene: {row.get('gene', 'ERBB2')}
-            Type: {row.get('mutation_type', '')}
-            Position: {row.get('protein_position', '')}
-            Significance: {row.get('clinical_significance', '')}
-            """
-            
-            # Generate embedding
-            vector = self.embedder.encode(embed_text).tolist()
-            
-            # Generate unique ID
-            mutation_id = row.get('mutation_id', f"MUT_{idx}")
-            doc_hash = hashlib.md5(mutation_id.encode()).hexdigest()[:8]
-            
-            # Create payload
-            payload = {
-                "mutation_id": mutation_id,
-                "gene": row.get('gene', 'ERBB2'),
-                "amino_acid_change": str(row.get('amino_acid_change', '')),
-                "mutation_type": str(row.get('mutation_type', 'Missense_Mutation')),
-                "protein_position": int(row.get('protein_position', 0)) if pd.notna(row.get('protein_position')) else 0,
-                "clinical_significance": str(row.get('clinical_significance', 'Unknown')),
-                "resistance_info": f"Resistance information for {mutation_id}",
-                "pubmed_refs": []
-            }
-            
-            # Add PubMed references if available
-            if 'pubmed_references' in row and isinstance(row['pubmed_references'], list):
-                payload["pubmed_refs"] = row['pubmed_references']
-            
-            points.append(
-                PointStruct(
-                    id=int(doc_hash, 16) % 1000000,
-                    vector=vector,
-                    payload=payload
-                )
-            )
+        # Build all embedding texts with vectorized string concatenation
+        texts = (
+            "Mutation: " + _str_column(mutations_df, 'amino_acid_change')
+            + "\nGene: " + _str_column(mutations_df, 'gene', 'ERBB2')
+            + "\nType: " + _str_column(mutations_df, 'mutation_type')
+            + "\nPosition: " + _str_column(mutations_df, 'protein_position')
+            + "\nSignificance: " + _str_column(mutations_df, 'clinical_significance')
+        ).tolist()
         
-        # Upload to Qdrant
-        self.client.upsert(
-            collection_name=self.collections["her2_mutations"]["name"],
-            points=points
-        )
+        # Fill and type-coerce payload columns once instead of per row
+        mutations_df = _normalize_columns(mutations_df, config["payload_defaults"])
+        if 'mutation_id' in mutations_df.columns:
+            mutations_df['mutation_id'] = mutations_df['mutation_id'].astype(str)
+        else:
+            mutations_df['mutation_id'] = [f"MUT_{i}" for i in range(len(mutations_df))]
+        mutations_df['pubmed_refs'] = _list_column(mutations_df, 'pubmed_references')
+        
+        # Generate unique IDs and payloads
+        ids = _point_ids(mutations_df['mutation_id'], config["id_offset"])
+        payloads = mutations_df[list(config["payload_schema"])].to_dict(orient='records')
+        
+        # Embed and upload to Qdrant
+        count = self._encode_and_upsert(config["name"], texts, ids, payloads)
         
-        print(f"✅ Loaded {len(points)} mutations to Qdrant")
+        print(f"✅ Loaded {count} mutations to Qdrant")
     
     def load_antibodies_to_qdrant(self, antibodies_df: pd.DataFrame):
         """Load antibody data to Qdrant"""
         print(f"Loading {len(antibodies_df)} antibodies to Qdrant...")
+        config = self.collections["antibody_db"]
         
-        points = []
+        # Embed on CDR3 (most important for binding)
+        cdr3 = antibodies_df['cdr3'] if 'cdr3' in antibodies_df.columns else pd.Series('', index=antibodies_df.index, dtype=object)
+        if 'sequence' in antibodies_df.columns:
+            # Fall back to the approximate CDR3 region of the full sequence
+            seq = antibodies_df['sequence'].fillna('').map(str)
+            approx_cdr3 = seq.where(seq.str.len() <= 45, seq.str[-30:-15])
+            cdr3 = cdr3.mask(cdr3 == '', approx_cdr3)
         
-        for idx, row in tqdm(antibodies_df.iterrows(), total=len(antibodies_df)):
-            # Create embedding from CDR3 (most important for binding)
-            cdr3 = row.get('cdr3', '')
-            if not cdr3 and 'sequence' in row:
-                # Extract approximate CDR3 region
-                seq = row['sequence']
-                cdr3 = seq[-30:-15] if len(seq) > 45 else seq
-            
-            embed_text = f"""
-            Antibody: {row.get('name', f'Antibody_{idx}')}
-            Target: {row.get('target', 'HER2')}
-            CDR3: {cdr3}
-            Source: {row.get('source', 'Unknown')}
-            Affinity: {row.get('affinity_nM', 'Unknown')} nM
-            """
-            
-            vector = self.embedder.encode(embed_text).tolist()
-            
-            # Generate unique ID
-            antibody_id = row.get('name', f"AB_{idx}")
-            doc_hash = hashlib.md5(antibody_id.encode()).hexdigest()[:8]
-            
-            # Create payload
-            payload = {
-                "antibody_id": antibody_id,
-                "name": row.get('name', f'Antibody_{idx}'),
-                "target": row.get('target', 'HER2'),
-                "sequence": row.get('sequence', ''),
-                "cdr1": row.get('cdr1', ''),
-                "cdr2": row.get('cdr2', ''),
-                "cdr3": cdr3,
-                "affinity_nM": float(row.get('affinity_nM', 0.0)) if pd.notna(row.get('affinity_nM')) else 0.0,
-                "source": row.get('source', 'Unknown'),
-                "pdb_id": row.get('pdb_id', ''),
-                "reference": f"Reference for {antibody_id}"
-            }
-            
-            points.append(
-                PointStruct(
-                    id=int(doc_hash, 16) % 1000000 + 1000000,  # Different ID range
-                    vector=vector,
-                    payload=payload
-                )
-            )
+        if 'name' in antibodies_df.columns:
+            names = antibodies_df['name'].map(str)
+            antibody_ids = names
+        else:
+            names = pd.Series([f'Antibody_{i}' for i in range(len(antibodies_df))], index=antibodies_df.index)
+            antibody_ids = pd.Series([f'AB_{i}' for i in range(len(antibodies_df))], index=antibodies_df.index)
         
-        self.client.upsert(
-            collection_name=self.collections["antibody_db"]["name"],
-            points=points
-        )
+        # Build all embedding texts with vectorized string concatenation
+        texts = (
+            "Antibody: " + names
+            + "\nTarget: " + _str_column(antibodies_df, 'target', 'HER2')
+            + "\nCDR3: " + cdr3.map(str)
+            + "\nSource: " + _str_column(antibodies_df, 'source', 'Unknown')
+            + "\nAffinity: " + _str_column(antibodies_df, 'affinity_nM', 'Unknown') + " nM"
+        ).tolist()
+        
+        # Fill and type-coerce payload columns once instead of per row
+        antibodies_df = _normalize_columns(antibodies_df, config["payload_defaults"])
+        antibodies_df['antibody_id'] = antibody_ids
+        antibodies_df['name'] = names
+        antibodies_df['cdr3'] = cdr3.fillna('')
+        
+        # Generate unique IDs and payloads
+        ids = _point_ids(antibody_ids, config["id_offset"])
+        payloads = antibodies_df[list(config["payload_schema"])].to_dict(orient='records')
+        
+        count = self._encode_and_upsert(config["name"], texts, ids, payloads)
         
-        print(f"✅ Loaded {len(points)} antibodies to Qdrant")
+        print(f"✅ Loaded {count} antibodies to Qdrant")
     
-    def load_abstracts_to_qdrant(self, abstracts_df: pd.DataFrame):
-        """Load scientific abstracts to Qdrant"""
+    def load_abstracts_to_qdrant(self, abstracts_df: pd.DataFrame, known_mutations: Optional[Iterable[str]] = None):
+        """Load scientific abstracts to Qdrant, tagging mentions of KNOWN_MUTATIONS plus the protein changes in known_mutations"""
         print(f"Loading {len(abstracts_df)} abstracts to Qdrant...")
+        config = self.collections["scientific_literature"]
         
-        points = []
+        # Use full text for embedding, falling back to title + abstract
+        if 'full_text' in abstracts_df.columns:
+            full_texts = abstracts_df['full_text'].map(str)
+        else:
+            full_texts = _str_column(abstracts_df, 'title') + ' ' + _str_column(abstracts_df, 'abstract')
+        # No pre-slicing: encode() truncates to the model's max_seq_length at token level
+        texts = full_texts.tolist()
         
-        for idx, row in tqdm(abstracts_df.iterrows(), total=len(abstracts_df)):
-            # Use full text for embedding
-            full_text = row.get('full_text', f"{row.get('title', '')} {row.get('abstract', '')}")
-            
-            vector = self.embedder.encode(full_text[:1000]).tolist()  # Limit length
-            
-            # Generate unique ID
-            pmid = row.get('pmid', f"ABS_{idx}")
-            doc_hash = hashlib.md5(str(pmid).encode()).hexdigest()[:8]
-            
-            # Extract mutation mentions (simplified)
-            mutation_mentions = []
-            if 'mutations' in row and isinstance(row['mutations'], list):
-                mutation_mentions = row['mutations']
-            elif 'abstract' in row:
-                # Simple keyword extraction
-                text = row['abstract'].lower()
-                if 'l755s' in text:
-                    mutation_mentions.append('L755S')
-                if 't798i' in text:
-                    mutation_mentions.append('T798I')
-                if 'd769h' in text:
-                    mutation_mentions.append('D769H')
-            
-            # Extract antibody mentions
-            antibody_mentions = []
-            if 'antibodies' in row and isinstance(row['antibodies'], list):
-                antibody_mentions = row['antibodies']
-            
-            payload = {
-                "pmid": str(pmid),
-                "title": row.get('title', ''),
-                "abstract": row.get('abstract', ''),
-                "full_text": full_text[:2000],  # Limit length
-                "year": int(row.get('year', 0)) if str(row.get('year', '0')).isdigit() else 0,
-                "author": row.get('author', ''),
-                "keywords": ['HER2', 'breast cancer', 'resistance'],
-                "mutation_mentions": mutation_mentions,
-                "antibody_mentions": antibody_mentions
-            }
-            
-            points.append(
-                PointStruct(
-                    id=int(doc_hash, 16) % 1000000 + 2000000,  # Different ID range
-                    vector=vector,
-                    payload=payload
-                )
-            )
+        # Extract mutation mentions for every abstract in a single scan
+        patterns = KNOWN_MUTATIONS
+        if known_mutations is not None:
+            # Catalog IDs can be placeholders (MUT_TCGA-...); keep only protein-change names
+            catalog = (str(m).strip() for m in known_mutations if pd.notna(m))
+            patterns = patterns | frozenset(m for m in catalog if PROTEIN_CHANGE.fullmatch(m))
+        mention_lists = [[] for _ in range(len(abstracts_df))]
+        if 'abstract' in abstracts_df.columns:
+            mention_lists = _find_mentions(abstracts_df['abstract'], patterns)
+        # Curated mutation lists take precedence over extracted mentions
+        if 'mutations' in abstracts_df.columns:
+            mention_lists = [
+                curated if isinstance(curated, list) else found
+                for curated, found in zip(abstracts_df['mutations'], mention_lists)
+            ]
         
-        self.client.upsert(
-            collection_name=self.collections["scientific_literature"]["name"],
-            points=points
-        )
+        # Fill and type-coerce payload columns once instead of per row
+        abstracts_df = _normalize_columns(abstracts_df, config["payload_defaults"])
+        if 'pmid' in abstracts_df.columns:
+            abstracts_df['pmid'] = abstracts_df['pmid'].astype(str)
+        else:
+            abstracts_df['pmid'] = [f"ABS_{i}" for i in range(len(abstracts_df))]
+        abstracts_df['full_text'] = full_texts.str[:2000]  # Limit length
+        abstracts_df['keywords'] = [['HER2', 'breast cancer', 'resistance'] for _ in range(len(abstracts_df))]
+        abstracts_df['mutation_mentions'] = mention_lists
+        abstracts_df['antibody_mentions'] = _list_column(abstracts_df, 'antibodies')
         
-        print(f"✅ Loaded {len(points)} abstracts to Qdrant")
+        # Generate unique IDs and payloads
+        ids = _point_ids(abstracts_df['pmid'], config["id_offset"])
+        payloads = abstracts_df[list(config["payload_schema"])].to_dict(orient='records')
+        
+        count = self._encode_and_upsert(config["name"], texts, ids, payloads)
+        
+        print(f"✅ Loaded {count} abstracts to Qdrant")
 
     def load_protocols_to_qdrant(self, protocols_df: pd.DataFrame):
         """Load synthesis protocols to Qdrant"""
-        if protocols_df.empty: return
+        if protocols_df.empty:
+            # Nothing to load, but the collection was created with indexing disabled
+            self._restore_indexing("synthesis_protocols")
+            return
         print(f"Loading {len(protocols_df)} protocols to Qdrant...")
-        points = []
-        for idx, row in protocols_df.iterrows():
-            text = f"Protocol: {row['name']}. Steps: {row['steps']}"
-            vector = self.embedder.encode(text[:1000]).tolist()
-            doc_hash = hashlib.md5(str(row['protocol_id']).encode()).hexdigest()[:8]
-            points.append(PointStruct(id=int(doc_hash, 16) % 1000000 + 4000000, vector=vector, payload=row.to_dict()))
-        self.client.upsert(collection_name="synthesis_protocols", points=points)
+        records = protocols_df.to_dict(orient='records')
+        texts = (
+            "Protocol: " + _str_column(protocols_df, 'name')
+            + ". Steps: " + _str_column(protocols_df, 'steps')
+        ).tolist()
+        ids = _point_ids(protocols_df['protocol_id'], self.collections["synthesis_protocols"]["id_offset"])
+        count = self._encode_and_upsert("synthesis_protocols", texts, ids, records)
+        print(f"✅ Loaded {count} protocols to Qdrant")
 
     def load_lab_notes_to_qdrant(self, notes_df: pd.DataFrame):
         """Load lab notes to Qdrant"""
-        if notes_df.empty: return
+        if notes_df.empty:
+            # Nothing to load, but the collection was created with indexing disabled
+            self._restore_indexing("lab_notes")
+            return
         print(f"Loading {len(notes_df)} lab notes to Qdrant...")
-        points = []
-        for idx, row in notes_df.iterrows():
-            text = f"Lab Note ({row['mutation_context']}): {row['text']}"
-            vector = self.embedder.encode(text[:1000]).tolist()
-            doc_hash = hashlib.md5(str(row['note_id']).encode()).hexdigest()[:8]
-            points.append(PointStruct(id=int(doc_hash, 16) % 1000000 + 5000000, vector=vector, payload=row.to_dict()))
-        self.client.upsert(collection_name="lab_notes", points=points)
+        records = notes_df.to_dict(orient='records')
+        texts = (
+            "Lab Note (" + _str_column(notes_df, 'mutation_context')
+            + "): " + _str_column(notes_df, 'text')
+        ).tolist()
+        ids = _point_ids(notes_df['note_id'], self.collections["lab_notes"]["id_offset"])
+        count = self._encode_and_upsert("lab_notes", texts, ids, records)
+        print(f"✅ Loaded {count} lab notes to Qdrant")
 
     def load_experimental_results_to_qdrant(self, results_df: pd.DataFrame):
         """Load granular experimental results to Qdrant"""
-        if results_df.empty: return
+        if results_df.empty:
+            # Nothing to load, but the collection was created with indexing disabled
+            self._restore_indexing("experimental_results")
+            return
         print(f"Loading {len(results_df)} experimental results to Qdrant...")
-        points = []
-        for idx, row in results_df.iterrows():
-            text = f"Result for {row['candidate_id']}: {row['type']} - {row['interpretation']}"
-            vector = self.embedder.encode(text[:1000]).tolist()
-            doc_hash = hashlib.md5(str(row['result_id']).encode()).hexdigest()[:8]
-            points.append(PointStruct(id=int(doc_hash, 16) % 1000000 + 6000000, vector=vector, payload=row.to_dict()))
-        self.client.upsert(collection_name="experimental_results", points=points)
+        records = results_df.to_dict(orient='records')
+        texts = (
+            "Result for " + _str_column(results_df, 'candidate_id')
+            + ": " + _str_column(results_df, 'type')
+            + " - " + _str_column(results_df, 'interpretation')
+        ).tolist()
+        ids = _point_ids(results_df['result_id'], self.collections["experimental_results"]["id_offset"])
+        count = self._encode_and_upsert("experimental_results", texts, ids, records)
+        print(f"✅ Loaded {count} experimental results to Qdrant")
     
-    def search_mutations(self, query: str, limit: int = 5):
-        """Search for mutations similar to query"""
-        query_vector = self.embedder.encode(query).tolist()
+    async def load_mutations_async(self, mutations_df: pd.DataFrame):
+        """Async variant of load_mutations_to_qdrant"""
+        await asyncio.to_thread(self.load_mutations_to_qdrant, mutations_df)
+
+    async def load_antibodies_async(self, antibodies_df: pd.DataFrame):
+        """Async variant of load_antibodies_to_qdrant"""
+        await asyncio.to_thread(self.load_antibodies_to_qdrant, antibodies_df)
+
+    async def load_abstracts_async(self, abstracts_df: pd.DataFrame, known_mutations: Optional[Iterable[str]] = None):
+        """Async variant of load_abstracts_to_qdrant"""
+        await asyncio.to_thread(self.load_abstracts_to_qdrant, abstracts_df, known_mutations)
+
+    async def load_protocols_async(self, protocols_df: pd.DataFrame):
+        """Async variant of load_protocols_to_qdrant"""
+        await asyncio.to_thread(self.load_protocols_to_qdrant, protocols_df)
+
+    async def load_lab_notes_async(self, notes_df: pd.DataFrame):
+        """Async variant of load_lab_notes_to_qdrant"""
+        await asyncio.to_thread(self.load_lab_notes_to_qdrant, notes_df)
+
+    async def load_experimental_results_async(self, results_df: pd.DataFrame):
+        """Async variant of load_experimental_results_to_qdrant"""
+        await asyncio.to_thread(self.load_experimental_results_to_qdrant, results_df)
+
+    async def seed_experiments_async(self):
+        """Async variant of seed_experiments"""
+        await asyncio.to_thread(self.seed_experiments)
+    
+    def _query_vectors(self, texts: List[str]) -> List[List[float]]:
+        """
+        Cached embeddings of queries; long texts are keyed and embedded by their first
+        QUERY_CACHE_KEY_CHARS chars. Cache misses are embedded together in one forward pass.
+        """
+        keys = [text[:QUERY_CACHE_KEY_CHARS] for text in texts]
+        found: Dict[str, Tuple[float, ...]] = {}
+        with self._query_cache_lock:
+            for key in keys:
+                if key in self._query_cache:
+                    self._query_cache.move_to_end(key)
+                    found[key] = self._query_cache[key]
         
+        misses = [key for key in dict.fromkeys(keys) if key not in found]
+        if misses:
+            vectors = self.embedder.encode(misses, batch_size=QUERY_BATCH_SIZE, **self._encode_kwargs)
+            with self._query_cache_lock:
+                for key, vector in zip(misses, vectors.tolist()):
+                    found[key] = self._query_cache[key] = tuple(vector)
+                    self._query_cache.move_to_end(key)
+                while len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        
+        return [list(found[key]) for key in keys]
+    
+    def _query_vector(self, text: str) -> List[float]:
+        """Cached embedding of a single query"""
+        return self._query_vectors([text])[0]
+    
+    async def _batched_encode(self, text: str) -> List[float]:
+        """Query embedding computed together with other concurrent callers' in one forward pass"""
+        loop = asyncio.get_running_loop()
+        # The queue and its worker belong to the event loop that first needs them
+        if self._batch_queue is None or self._batch_loop is not loop:
+            self._batch_queue = asyncio.Queue()
+            self._batch_loop = loop
+            self._batch_worker = loop.create_task(self._run_encode_batches(self._batch_queue))
+        future = loop.create_future()
+        await self._batch_queue.put((text, future))
+        return await future
+    
+    async def _run_encode_batches(self, queue: asyncio.Queue):
+        """Drain queued queries every QUERY_BATCH_WINDOW seconds and embed up to QUERY_BATCH_SIZE at a time"""
+        while True:
+            pending = [await queue.get()]
+            try:
+                await asyncio.sleep(QUERY_BATCH_WINDOW)
+                while len(pending) < QUERY_BATCH_SIZE and not queue.empty():
+                    pending.append(queue.get_nowait())
+                
+                # Cached queries are answered without the model; only the misses share a forward pass
+                vectors = await asyncio.to_thread(self._query_vectors, [text for text, _ in pending])
+            except asyncio.CancelledError:
+                for _, future in pending:
+                    future.cancel()
+                raise
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), vector in zip(pending, vectors):
+                if not future.done():
+                    future.set_result(vector)
+    
+    async def aclose(self):
+        """Stop the async query batcher; await from the event loop that ran the async searches"""
+        worker, loop = self._batch_worker, self._batch_loop
+        self._batch_queue = self._batch_loop = self._batch_worker = None
+        if worker is None or worker.done() or loop is not asyncio.get_running_loop():
+            return
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+    
+    def _query_collection(self, col_name: str, query_vector: List[float], limit: int,
+                          query_filter: Optional[Filter] = None) -> List[Dict]:
+        """Nearest points of one collection to query_vector, formatted by the collection's hit formatter"""
         results = self.client.query_points(
-            collection_name=self.collections["her2_mutations"]["name"],
+            collection_name=self.collections[col_name]["name"],
             query=query_vector,
+            query_filter=query_filter,
+            with_payload=self._RESULT_FIELDS[col_name],
             limit=limit
         ).points
         
-        return [
-            {
-                "score": hit.score,
-                "mutation_id": hit.payload.get("mutation_id"),
-                "amino_acid_change": hit.payload.get("amino_acid_change"),
-                "clinical_significance": hit.payload.get("clinical_significance"),
-                "protein_position": hit.payload.get("protein_position"),
-                "pubmed_refs": hit.payload.get("pubmed_refs", [])
-            }
-            for hit in results
-        ]
+        format_hit = getattr(self, self._HIT_FORMATTERS[col_name])
+        return [format_hit(hit) for hit in results]
+    
+    def search_mutations(self, query: str, limit: int = 5):
+        """Search for mutations similar to query"""
+        return self._query_collection("her2_mutations", self._query_vector(query), limit)
+    
+    def search_mutations_batch(self, queries: List[str], limit: int = 5) -> List[List[Dict]]:
+        """Search mutations for several queries with one encode pass and one batched request"""
+        return self.search_multi([SearchRequest("her2_mutations", query, limit) for query in queries])
+    
+    def search_multi(self, requests: List[SearchRequest]) -> List[List[Dict]]:
+        """
+        Run several searches at once.
+        Queries missing from the embedding cache are encoded in one pass and each collection
+        gets one query_batch_points call; results come back in request order, formatted like
+        the matching search_* method.
+        """
+        if not requests:
+            return []
+        vectors = self._query_vectors([request.query for request in requests])
+        
+        by_collection: Dict[str, List[int]] = {}
+        for i, request in enumerate(requests):
+            by_collection.setdefault(request.collection, []).append(i)
+        
+        results: List[List[Dict]] = [[] for _ in requests]
+        for col_name, indices in by_collection.items():
+            responses = self.client.query_batch_points(
+                collection_name=self.collections[col_name]["name"],
+                requests=[
+                    QueryRequest(
+                        query=vectors[i],
+                        limit=requests[i].limit,
+                        filter=self._mutation_filter(requests[i].mutation_filter),
+                        with_payload=self._RESULT_FIELDS[col_name]
+                    )
+                    for i in indices
+                ]
+            )
+            format_hit = getattr(self, self._HIT_FORMATTERS[col_name])
+            for i, response in zip(indices, responses):
+                results[i] = [format_hit(hit) for hit in response.points]
+        
+        return results
+    
+    @staticmethod
+    def _mutation_hit(hit) -> Dict:
+        """Result dict for a her2_mutations point"""
+        return {
+            "score": hit.score,
+            "mutation_id": hit.payload.get("mutation_id"),
+            "amino_acid_change": hit.payload.get("amino_acid_change"),
+            "clinical_significance": hit.payload.get("clinical_significance"),
+            "protein_position": hit.payload.get("protein_position"),
+            "pubmed_refs": hit.payload.get("pubmed_refs", [])
+        }
     
     def search_antibodies_by_mutation(self, mutation_id: str, limit: int = 10):
         """Search for antibodies relevant to a specific mutation"""
@@ -382,81 +835,103 @@ class QdrantRealDataManager:
         
         # Search for antibodies with similar context
         query_text = f"Antibodies targeting HER2 with mutation {mutation_id} at position {mutation.get('protein_position', '')}"
-        query_vector = self.embedder.encode(query_text).tolist()
-        
-        results = self.client.query_points(
-            collection_name=self.collections["antibody_db"]["name"],
-            query=query_vector,
-            limit=limit
-        ).points
-        
-        return [
-            {
-                "score": hit.score,
-                "antibody_id": hit.payload.get("antibody_id"),
-                "name": hit.payload.get("name"),
-                "cdr3": hit.payload.get("cdr3"),
-                "affinity_nM": hit.payload.get("affinity_nM"),
-                "source": hit.payload.get("source")
-            }
-            for hit in results
-        ]
+        return self._query_collection("antibody_db", self._query_vector(query_text), limit)
+    
+    @staticmethod
+    def _antibody_hit(hit) -> Dict:
+        """Result dict for an antibody_database point"""
+        return {
+            "score": hit.score,
+            "antibody_id": hit.payload.get("antibody_id"),
+            "name": hit.payload.get("name"),
+            "cdr3": hit.payload.get("cdr3"),
+            "affinity_nM": hit.payload.get("affinity_nM"),
+            "source": hit.payload.get("source")
+        }
     
     def search_literature(self, query: str, mutation_filter: str = None, limit: int = 5):
         """Search scientific literature with optional mutation filter"""
-        query_vector = self.embedder.encode(query).tolist()
-        
-        # Apply filter if provided
-        search_filter = None
-        if mutation_filter:
-            search_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="mutation_mentions",
-                        match=MatchValue(value=mutation_filter)
-                    )
-                ]
-            )
-        
-        results = self.client.query_points(
-            collection_name=self.collections["scientific_literature"]["name"],
-            query=query_vector,
-            query_filter=search_filter,
-            limit=limit
-        ).points
-        
-        return [
-            {
-                "score": hit.score,
-                "pmid": hit.payload.get("pmid"),
-                "title": hit.payload.get("title"),
-                "abstract": hit.payload.get("abstract")[:200] + "...",
-                "year": hit.payload.get("year"),
-                "mutation_mentions": hit.payload.get("mutation_mentions", [])
-            }
-            for hit in results
-        ]
+        return self._query_collection(
+            "scientific_literature", self._query_vector(query), limit, self._mutation_filter(mutation_filter)
+        )
+    
+    @staticmethod
+    def _mutation_filter(mutation_id: Optional[str]) -> Optional[Filter]:
+        """Filter to papers mentioning mutation_id, or None for no filtering"""
+        if not mutation_id:
+            return None
+        return Filter(
+            must=[
+                FieldCondition(
+                    key="mutation_mentions",
+                    match=MatchValue(value=mutation_id)
+                )
+            ]
+        )
+    
+    @staticmethod
+    def _literature_hit(hit) -> Dict:
+        """Result dict for a scientific_literature point"""
+        return {
+            "score": hit.score,
+            "pmid": hit.payload.get("pmid"),
+            "title": hit.payload.get("title"),
+            "abstract": hit.payload.get("abstract")[:200] + "...",
+            "year": hit.payload.get("year"),
+            "mutation_mentions": hit.payload.get("mutation_mentions", [])
+        }
     
     def search_experiments(self, query: str, limit: int = 5):
         """Search for similar lab experiments"""
-        query_vector = self.embedder.encode(query).tolist()
-        
-        results = self.client.query_points(
-            collection_name=self.collections["lab_experiments"]["name"],
-            query=query_vector,
-            limit=limit
-        ).points
-        
-        return [
-            {
-                "score": hit.score,
-                "exp_id": hit.payload.get("exp_id"),
-                "outcome": hit.payload.get("outcome"),
-                "notes": hit.payload.get("notes"),
-                "measurements": hit.payload.get("measurements")
-            }
-            for hit in results
-        ]
+        return self._query_collection("lab_experiments", self._query_vector(query), limit)
+    
+    @staticmethod
+    def _experiment_hit(hit) -> Dict:
+        """Result dict for a lab_experiments point"""
+        return {
+            "score": hit.score,
+            "exp_id": hit.payload.get("exp_id"),
+            "outcome": hit.payload.get("outcome"),
+            "notes": hit.payload.get("notes"),
+            "measurements": hit.payload.get("measurements")
+        }
+    
+    # Result formatter per collection key, shared by the single and batched searches
+    _HIT_FORMATTERS = {
+        "her2_mutations": "_mutation_hit",
+        "antibody_db": "_antibody_hit",
+        "scientific_literature": "_literature_hit",
+        "lab_experiments": "_experiment_hit"
+    }
+    
+    # Payload fields each formatter reads; searches fetch only these (literature skips full_text)
+    _RESULT_FIELDS = {
+        "her2_mutations": ["mutation_id", "amino_acid_change", "clinical_significance", "protein_position", "pubmed_refs"],
+        "antibody_db": ["antibody_id", "name", "cdr3", "affinity_nM", "source"],
+        "scientific_literature": ["pmid", "title", "abstract", "year", "mutation_mentions"],
+        "lab_experiments": ["exp_id", "outcome", "notes", "measurements"]
+    }
+    
+    async def asearch_mutations(self, query: str, limit: int = 5):
+        """Async variant of search_mutations; concurrent queries share one encode batch"""
+        query_vector = await self._batched_encode(query)
+        return await asyncio.to_thread(self._query_collection, "her2_mutations", query_vector, limit)
+    
+    async def asearch_literature(self, query: str, mutation_filter: str = None, limit: int = 5):
+        """Async variant of search_literature; concurrent queries share one encode batch"""
+        query_vector = await self._batched_encode(query)
+        return await asyncio.to_thread(
+            self._query_collection, "scientific_literature", query_vector, limit, self._mutation_filter(mutation_filter)
+        )
+    
+    async def asearch_experiments(self, query: str, limit: int = 5):
+        """Async variant of search_experiments; concurrent queries share one encode batch"""
+        query_vector = await self._batched_encode(query)
+        return await asyncio.to_thread(self._query_collection, "lab_experiments", query_vector, limit)
+    
+    async def aget_collection_stats(self):
+        """Async variant of get_collection_stats"""
+        return await asyncio.to_thread(self.get_collection_stats)
     
     def get_collection_stats(self):
         """Get statistics for all collections"""
@@ -487,13 +962,18 @@ class QdrantRealDataManager:
                 {"exp_id": "EXP-H3-001", "mutation": "D769H", "conditions": "pH 7.2, 37°C, ELISA", "measurements": 0.45, "outcome": "Success", "notes": "Electrostatic interaction restored via Histidine-targeting motifs."},
                 {"exp_id": "EXP-H3-002", "mutation": "L755S", "conditions": "pH 5.5, 37°C, Stability", "measurements": 0.31, "outcome": "Failure", "notes": "Protein aggregation observed in acidic endosomal-mimic conditions."}
             ])
-            points = []
-            for idx, row in exp_data.iterrows():
-                text = f"Experiment {row['exp_id']} for {row['mutation']}: {row['notes']}"
-                vector = self.embedder.encode(text).tolist()
-                points.append(PointStruct(id=3000000+idx, vector=vector, payload=row.to_dict()))
-            self.client.upsert(collection_name="lab_experiments", points=points)
-            print(f"✅ Seeded {len(points)} experiments")
+            records = exp_data.to_dict(orient='records')
+            texts = (
+                "Experiment " + _str_column(exp_data, 'exp_id')
+                + " for " + _str_column(exp_data, 'mutation')
+                + ": " + _str_column(exp_data, 'notes')
+            ).tolist()
+            ids = _point_ids(exp_data['exp_id'], self.collections["lab_experiments"]["id_offset"])
+            count = self._encode_and_upsert("lab_experiments", texts, ids, records)
+            print(f"✅ Seeded {count} experiments")
+        else:
+            # Already populated: just make sure indexing is back on after initialize_collections
+            self._restore_indexing(self.collections["lab_experiments"]["name"])
 
 if __name__ == "__main__":
     # Test the Qdrant setup
@@ -503,12 +983,18 @@ if __name__ == "__main__":
     # Load sample data
     from data_loader import HER2DataLoader
     loader = HER2DataLoader()
-    mutations, antibodies, abstracts = loader.process_all_data()
+    mutations, antibodies, abstracts, *_ = loader.process_all_data()
     
-    # Load data to Qdrant
-    qdrant_manager.load_mutations_to_qdrant(mutations)
-    qdrant_manager.load_antibodies_to_qdrant(antibodies)
-    qdrant_manager.load_abstracts_to_qdrant(abstracts)
+    # Load data to Qdrant; torch and the Qdrant client release the GIL, so the
+    # three collections' encode and upload work overlaps across threads
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(qdrant_manager.load_mutations_to_qdrant, mutations),
+            executor.submit(qdrant_manager.load_antibodies_to_qdrant, antibodies),
+            executor.submit(qdrant_manager.load_abstracts_to_qdrant, abstracts, mutations.get('mutation_id'))
+        ]
+        for future in futures:
+            future.result()
     
     # Load sample experiments
     exp_data = pd.DataFrame([
@@ -516,14 +1002,15 @@ if __name__ == "__main__":
         {"exp_id": "EXP002", "mutation": "T798I", "conditions": "pH 6.8, 37C", "measurements": 0.12, "outcome": "Failure", "notes": "Poor stability in acidic conditions"}
     ])
     
-    points = []
-    for idx, row in exp_data.iterrows():
-        text = f"Experiment {row['exp_id']} for {row['mutation']}: {row['notes']}"
-        vector = qdrant_manager.embedder.encode(text).tolist()
-        points.append(PointStruct(id=3000000+idx, vector=vector, payload=row.to_dict()))
-    
-    qdrant_manager.client.upsert(collection_name="lab_experiments", points=points)
-    print(f"✅ Loaded {len(points)} sample experiments")
+    records = exp_data.to_dict(orient='records')
+    texts = (
+        "Experiment " + _str_column(exp_data, 'exp_id')
+        + " for " + _str_column(exp_data, 'mutation')
+        + ": " + _str_column(exp_data, 'notes')
+    ).tolist()
+    ids = _point_ids(exp_data['exp_id'], qdrant_manager.collections["lab_experiments"]["id_offset"])
+    count = qdrant_manager._encode_and_upsert("lab_experiments", texts, ids, records)
+    print(f"✅ Loaded {count} sample experiments")
 
     # Get stats
     stats = qdrant_manager.get_collection_stats()
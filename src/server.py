@@ -1,8 +1,12 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Optional
+import asyncio
+import orjson
 import os
+import pandas as pd
 import sys
 
 # Add src to path
@@ -10,7 +14,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from pipeline import RealDataOrchestrator
 
-app = FastAPI(title="HER2-ResistAID API")
+app = FastAPI(title="HER2-ResistAID API", default_response_class=ORJSONResponse)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -24,11 +28,42 @@ app.add_middleware(
 # Global orchestrator instance
 orchestrator = None
 
+def _records_json(df: pd.DataFrame) -> bytes:
+    """A frame's rows serialized once as a JSON array (NaN becomes null)"""
+    return orjson.dumps(df.to_dict('records'))
+
+def _records_json_by(df: pd.DataFrame, column: str) -> Dict[str, bytes]:
+    """_records_json for each group of rows sharing a value of column"""
+    if column not in df.columns:
+        return {}
+    return {str(key): _records_json(group) for key, group in df.groupby(column)}
+
+def _json_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
 @app.on_event("startup")
 async def startup_event():
     global orchestrator
     print("🚀 Starting HER2-ResistAID Orchestrator...")
-    orchestrator = RealDataOrchestrator(use_existing_data=True)
+    # Build off the event loop: setup blocks on model loading and runs its own asyncio loop
+    orchestrator = await asyncio.to_thread(RealDataOrchestrator, use_existing_data=True)
+    
+    # The advanced data tables are static after startup: serialize them once, including
+    # the per-candidate slices served by /results and /images
+    app.state.cached = {
+        "protocols": _records_json(orchestrator.protocols),
+        "lab_notes": _records_json(orchestrator.lab_notes),
+        "results": _records_json(orchestrator.experimental_results),
+        "results_by_candidate": _records_json_by(orchestrator.experimental_results, 'candidate_id'),
+        "images": _records_json(orchestrator.images),
+        "images_by_candidate": _records_json_by(orchestrator.images, 'candidate_id')
+    }
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Cancel the query-embedding batcher task rather than leave it pending on loop teardown
+    if orchestrator:
+        await orchestrator.qdrant_manager.aclose()
 
 class MutationRequest(BaseModel):
     mutation_id: str
@@ -42,7 +77,7 @@ async def root():
 async def get_stats():
     if not orchestrator:
         raise HTTPException(status_code=503, detail="System initializing")
-    return orchestrator.qdrant_manager.get_collection_stats()
+    return await orchestrator.qdrant_manager.aget_collection_stats()
 
 @app.post("/analyze")
 async def analyze_mutation(request: MutationRequest):
@@ -50,7 +85,9 @@ async def analyze_mutation(request: MutationRequest):
         raise HTTPException(status_code=503, detail="System initializing")
     
     try:
-        report = orchestrator.run_for_mutation(
+        # The pipeline is CPU-bound; run it off the event loop so other requests keep being served
+        report = await asyncio.to_thread(
+            orchestrator.run_for_mutation,
             request.mutation_id, 
             num_candidates=request.num_candidates
         )
@@ -60,6 +97,28 @@ async def analyze_mutation(request: MutationRequest):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+def _ndjson_stages(mutation_id: str, num_candidates: int):
+    """Pipeline stages as newline-delimited JSON; a failure mid-run becomes a final error line"""
+    try:
+        for stage in orchestrator.stream_for_mutation(mutation_id, num_candidates=num_candidates):
+            yield orjson.dumps(stage, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        yield orjson.dumps({"stage": "error", "detail": str(e)}) + b"\n"
+
+@app.post("/analyze/stream")
+async def analyze_mutation_stream(request: MutationRequest):
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="System initializing")
+    
+    # Starlette iterates the sync generator in its threadpool, so each stage is sent as soon
+    # as it is computed without blocking the event loop
+    return StreamingResponse(
+        _ndjson_stages(request.mutation_id, request.num_candidates),
+        media_type="application/x-ndjson"
+    )
+
 @app.get("/mutations")
 async def list_mutations():
     if not orchestrator:
@@ -71,37 +130,37 @@ async def list_mutations():
 async def get_literature(query: Optional[str] = "HER2 resistance"):
     if not orchestrator:
         return []
-    return orchestrator.qdrant_manager.search_literature(query=query, limit=20)
+    return await orchestrator.qdrant_manager.asearch_literature(query=query, limit=20)
 
 @app.get("/experiments")
 async def get_experiments(query: Optional[str] = "HER2"):
     if not orchestrator:
         return []
-    return orchestrator.qdrant_manager.search_experiments(query=query, limit=20)
+    return await orchestrator.qdrant_manager.asearch_experiments(query=query, limit=20)
 
 @app.get("/protocols")
 async def get_protocols():
     if not orchestrator: return []
-    return orchestrator.protocols.to_dict('records')
+    return _json_response(app.state.cached["protocols"])
 
 @app.get("/lab-notes")
 async def get_lab_notes():
     if not orchestrator: return []
-    return orchestrator.lab_notes.to_dict('records')
+    return _json_response(app.state.cached["lab_notes"])
 
 @app.get("/results")
 async def get_results(candidate_id: Optional[str] = None):
     if not orchestrator: return []
     if candidate_id:
-        return orchestrator.experimental_results[orchestrator.experimental_results['candidate_id'] == candidate_id].to_dict('records')
-    return orchestrator.experimental_results.to_dict('records')
+        return _json_response(app.state.cached["results_by_candidate"].get(candidate_id, b"[]"))
+    return _json_response(app.state.cached["results"])
 
 @app.get("/images")
 async def get_images(candidate_id: Optional[str] = None):
     if not orchestrator: return []
     if candidate_id:
-        return orchestrator.images[orchestrator.images['candidate_id'] == candidate_id].to_dict('records')
-    return orchestrator.images.to_dict('records')
+        return _json_response(app.state.cached["images_by_candidate"].get(candidate_id, b"[]"))
+    return _json_response(app.state.cached["images"])
 
 if __name__ == "__main__":
     import uvicorn